@@ -25,10 +25,14 @@ def masked(a, b):
     # https://docs.scipy.org/doc/numpy/reference/generated/numpy.dtype.kind.html#numpy-dtype-kind
     # https://docs.scipy.org/doc/numpy/reference/arrays.scalars.html#arrays-scalars
 
+    # the scalar fill value is broadcast, no filler array is allocated.
+    # A scalar nan does not promote like a float64 array does, cast to
+    # keep float64 (or wider) as the result.
     if a.dtype.kind in ('i', 'u', 'f', 'c'):
-        return np.where(b, a, np.full(len(a), np.nan))
+        dtype = np.result_type(a.dtype, np.float64)
+        return np.where(b, a, np.nan).astype(dtype, copy=False)
     else:
-        return np.where(b, a, np.full(len(a), None))
+        return np.where(b, a, None)
 
 
 def startstop_bool(startb, stopb):
@@ -75,23 +79,56 @@ def startstop_bool(startb, stopb):
             yield False
 
 
+def startstop_array(startb, stopb):
+    """Return the startstop_bool result as a boolean array.
+
+    Same semantics as startstop_bool (which see) but computed with
+    numpy in a few passes over the data instead of a python loop.
+
+    Parameters
+    ----------
+    startb, stopb : sequence
+        Elements are tested for truth like with `if el...`
+
+    """
+
+    startb, stopb = _truth_array(startb), _truth_array(stopb)
+    count = min(len(startb), len(stopb))
+    startb, stopb = startb[:count], stopb[:count]
+
+    # an element is true if the latest start trigger up to and including
+    # it is more recent than the latest stop trigger. A stop dominates a
+    # start on the same element.
+    index = np.arange(count)
+    laststart = np.maximum.accumulate(np.where(startb & ~stopb, index, -1))
+    laststop = np.maximum.accumulate(np.where(stopb, index, -1))
+
+    return laststart > laststop
+
+
+def _truth_array(seq):
+    """Return a boolean array with the truth values of elements in seq."""
+
+    # np.asarray makes a 0-d object array of an iterator
+    if not hasattr(seq, '__len__'):
+        seq = list(seq)
+    a = np.asarray(seq)
+    if a.dtype.kind == 'b':
+        return a
+    elif a.dtype.kind in ('i', 'u', 'f', 'c'):
+        return a.astype(bool)
+    else:
+        return a.astype(object).astype(bool)
+
+
 def slicelist(b):
     """Produce a list of slices given the boolean array b.
 
     Start and stop in each slice describe the True sections in b."""
 
-    slicelst = []
-    started, e = False, False
-
-    for i, e in enumerate(b):
-        if not started and e:
-            start = i
-            started = True
-        elif started and not e:
-            slicelst.append(slice(start, i))
-            started = False
-
-    if e:
-        slicelst.append(slice(start, i + 1))  # True in the end.
+    # pad with False so every True section has a rising and a falling
+    # edge, then the edges alternate start, stop, start, stop...
+    padded = np.concatenate(([False], _truth_array(b), [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
 
-    return slicelst
+    return list(map(slice, edges[::2].tolist(), edges[1::2].tolist()))
@@ -13,6 +13,11 @@ from channelpack.pack import ChannelPack
 # dbf spec
 # http://www.clicketyclick.dk/databases/xbase/format/dbf.html#DBF_STRUCT
 
+# file header: number of records, header length
+_HEADER = struct.Struct('<xxxxLH22x')
+# field descriptor: name, type, size, decimal places
+_FIELDDESC = struct.Struct('<11sc4xBB14x')
+
 
 def dbfreader(f):
     """Returns an iterator over records in a Xbase DBF file.
@@ -26,12 +31,12 @@ def dbfreader(f):
 
     """
 
-    numrec, lenheader = struct.unpack('<xxxxLH22x', f.read(32))
+    numrec, lenheader = _HEADER.unpack(f.read(_HEADER.size))
     numfields = (lenheader - 33) // 32
 
     fields = []
     for fieldno in range(numfields):
-        name, typ, size, deci = struct.unpack('<11sc4xBB14x', f.read(32))
+        name, typ, size, deci = _FIELDDESC.unpack(f.read(_FIELDDESC.size))
         name = name.replace(b'\0', b'')       # eliminate NULs from string
         name = name.decode('ascii')
         fields.append((name, typ, size, deci))
@@ -42,10 +47,10 @@ def dbfreader(f):
     assert terminator == b'\r'
 
     fields.insert(0, ('DeletionFlag', 'C', 1, 0))
-    fmt = ''.join(['%ds' % fieldinfo[2] for fieldinfo in fields])
-    fmtsiz = struct.calcsize(fmt)
+    recstruct = struct.Struct(''.join(['%ds' % fieldinfo[2]
+                                       for fieldinfo in fields]))
     for i in range(numrec):
-        record = struct.unpack(fmt, f.read(fmtsiz))
+        record = recstruct.unpack(f.read(recstruct.size))
         if record[0] != b' ':
             continue                        # deleted record
         result = []
@@ -97,7 +102,7 @@ def dbfrecords(f, names):
     File should be opened for binary reads.
 
     """
-    numrec, lenheader = struct.unpack('<xxxxLH22x', f.read(32))
+    numrec, lenheader = _HEADER.unpack(f.read(_HEADER.size))
     numfields = (lenheader - 33) // 32
 
     # discarded in main loop
@@ -105,7 +110,7 @@ def dbfrecords(f, names):
                  '1s', struct.calcsize('1s'), True, 0)]
 
     for fieldno in range(numfields):
-        name, typ, size, deci = struct.unpack('<11sc4xBB14x', f.read(32))
+        name, typ, size, deci = _FIELDDESC.unpack(f.read(_FIELDDESC.size))
         name = name.replace(b'\0', b'')       # eliminate NULs from string
         name = name.decode('ascii')
         fmt = str(size) + 's'
@@ -121,12 +126,16 @@ def dbfrecords(f, names):
     terminator = f.read(1)
     assert terminator == b'\r'
 
+    # read each record in one go and slice out the selected fields,
+    # instead of a seek and read per field
+    recsiz = fields[-1].seekme + fields[-1].fmtsiz
     for i in range(numrec):
-        refaddr = f.tell()
-        record = []
-        for field in selfields:
-            f.seek(refaddr + field.seekme)
-            record.append(struct.unpack(field.fmt, f.read(field.fmtsiz))[0])
+        recbytes = f.read(recsiz)
+        if len(recbytes) != recsiz:
+            raise ValueError('record {} of {} is truncated, {} of {} bytes'
+                             .format(i + 1, numrec, len(recbytes), recsiz))
+        record = [recbytes[field.seekme:field.seekme + field.fmtsiz]
+                  for field in selfields]
 
         if record[0] != b' ':
             continue                        # deleted record
@@ -159,7 +168,6 @@ def dbfrecords(f, names):
             else:
                 value = value.decode('ascii')  # type = 'C' or other type
             result.append(value)
-        f.seek(refaddr + fields[-1].seekme + fields[-1].fmtsiz)
         yield result
 
 
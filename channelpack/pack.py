@@ -11,9 +11,31 @@ import numpy as np
 
 from channelpack import datautils
 
+_fallback_rxs = {}              # compiled fallback regexes by prefix
+_string_types = (str, type(u''))  # str and unicode on python 2
+
+
+def _fallback_rx(prefix):
+    """Return a compiled regex matching prefix followed by digits.
+
+    The compiled pattern is kept per prefix, FALLBACK_PREFIX rarely
+    changes but is consulted on every failed name lookup.
+
+    """
+    try:
+        return _fallback_rxs[prefix]
+    except KeyError:
+        return _fallback_rxs.setdefault(prefix,
+                                        re.compile(prefix + r'(\d+)'))
+
 
 class IntKeyDict(dict):
-    """Subclass of dict that only accepts integers as keys."""
+    """Subclass of dict that only accepts integers as keys.
+
+    A reverse mapping of values to keys is kept on demand for lookups
+    by value, see `_key_of`. Any modification of the dict drops it.
+
+    """
 
     def __init__(self, *args, **kwargs):
         if args and (len(args) > 1 or isinstance(args[0], str)):
@@ -23,8 +45,13 @@ class IntKeyDict(dict):
     def __setitem__(self, key, value):
         if not isinstance(key, int):
             raise TypeError(self._key_error_message(key))
+        self._inverse = None
         super(IntKeyDict, self).__setitem__(key, value)
 
+    def __delitem__(self, key):
+        self._inverse = None
+        super(IntKeyDict, self).__delitem__(key)
+
     def update(self, *args, **kwargs):
 
         # only concern about keys being integers, let parent handle
@@ -47,13 +74,50 @@ class IntKeyDict(dict):
             if not isinstance(key, int):
                 raise TypeError(self._key_error_message(key))
 
+        self._inverse = None
         super(IntKeyDict, self).update(*args, **kwargs)
 
+    def __ior__(self, other):
+        # dict.__ior__ (python 3.9+) does not call update
+        self.update(other)
+        return self
+
     def setdefault(self, key, value=None):
         if not isinstance(key, int):
             raise TypeError(self._key_error_message)
+        self._inverse = None
         super(IntKeyDict, self).setdefault(key, value)
 
+    def pop(self, *args):
+        self._inverse = None
+        return super(IntKeyDict, self).pop(*args)
+
+    def popitem(self):
+        self._inverse = None
+        return super(IntKeyDict, self).popitem()
+
+    def clear(self):
+        self._inverse = None
+        super(IntKeyDict, self).clear()
+
+    def _key_of(self, value):
+        """Return the first key (in iteration order) having value.
+
+        Raise KeyError if there is no such key. Unhashable values in the
+        dict are never found.
+
+        """
+        inverse = getattr(self, '_inverse', None)
+        if inverse is None:
+            inverse = {}
+            for key, val in self.items():
+                try:
+                    inverse.setdefault(val, key)
+                except TypeError:
+                    pass        # unhashable
+            self._inverse = inverse
+        return inverse[value]
+
     def _key_error_message(self, key):
         return 'Only integer keys accepted, got: {}'.format(repr(key))
 
@@ -72,7 +136,7 @@ class NpDict(IntKeyDict):
         self.update(*args, **kwargs)
 
     def __setitem__(self, key, value):
-        array = np.array(value, copy=False)
+        array = np.asarray(value)
         self._check_raise_ndim(array, value)
         super(NpDict, self).__setitem__(key, array)
 
@@ -84,7 +148,7 @@ class NpDict(IntKeyDict):
         if args and isinstance(args[0], dict):
             proxydict = {}
             for key in args[0]:
-                array = np.array(args[0][key], copy=False)
+                array = np.asarray(args[0][key])
                 self._check_raise_ndim(array, args[0][key])
                 proxydict[key] = array
 
@@ -98,7 +162,7 @@ class NpDict(IntKeyDict):
             # loop over the key, value pairs
             for seq in args[0]:
                 if hasattr(seq, '__getitem__'):
-                    array = np.array(seq[-1], copy=False)
+                    array = np.asarray(seq[-1])
                     self._check_raise_ndim(array, seq[-1])
                     # let possible invalid length of key, value pairs remain
                     proxypairs.append([val for val in seq[:-1]] + [array])
@@ -114,14 +178,14 @@ class NpDict(IntKeyDict):
             proxyargs = args
 
         for key, value in kwargs.items():
-            array = np.array(value, copy=False)
+            array = np.asarray(value)
             self._check_raise_ndim(array, value)
             proxykwargs[key] = array
 
         super(NpDict, self).update(*proxyargs, **proxykwargs)
 
     def setdefault(self, key, value=None):
-        array = np.array(value, copy=False)
+        array = np.asarray(value)
         self._check_raise_ndim(array, value)
         super(NpDict, self).setdefault(key, array)  # return? FIXME
 
@@ -157,7 +221,7 @@ class ChannelPack(object):
         arrays are returned as is (the default). If 'nan', elements in
         the returned array with corresponding False element in `mask`
         are replaced with numpy.nan or None, equivalent to
-        `np.where(array, mask, np.full(len(array), np.nan))`. 'filter'
+        `np.where(mask, array, np.nan)`. 'filter'
         yeilds the equivalent to `array[mask]` -- the array is stripped
         down to elements with corresponding True elements in `mask`. The
         effect of this attribute can be overridden in calls of the
@@ -229,7 +293,7 @@ class ChannelPack(object):
             raise TypeError('Expected a numpy array')
         elif name == 'mask':
             object.__setattr__(self, name, value)
-            self._cached_slicelist = self._slicelist()
+            self._cached_slicelist = None  # computed when needed
             if self.mindur is not None:
                 self.duration(self.mindur, samplerate=1, mindur=True)
         elif name == 'mindur' and not ((value is None)
@@ -270,7 +334,7 @@ class ChannelPack(object):
         Same is true for the attribute names.
 
         Array dtypes in respective pack.data are at the mercy of numpy
-        append function.
+        concatenate function.
 
         Extend `filenames` with `other.filenames`.
 
@@ -291,15 +355,16 @@ class ChannelPack(object):
         if not self.data:
             self.data = other.data
         elif other.data:
-            if not set(self.data.keys()) == set(other.data.keys()):
+            if not set(self.data) == set(other.data):
                 raise ValueError('Data dicts set of keys not equal')
             for key in other.data:
-                self.data[key] = np.append(self.data[key], other.data[key])
+                self.data[key] = np.concatenate((self.data[key],
+                                                 other.data[key]))
 
         if not self.names:
             self.names = other.names
         elif other.names:
-            if not set(self.names.keys()) == set(other.names.keys()):
+            if not set(self.names) == set(other.names):
                 raise ValueError('names dicts set of keys not equal')
 
         self.filenames.extend(other.filenames)
@@ -318,8 +383,8 @@ class ChannelPack(object):
         if not self.data:
             self.mask = np.array([])
         else:
-            lowest = sorted(self.data)[0]
-            self.mask = self.data[lowest] == self.data[lowest]
+            lowest = min(self.data)
+            self.mask = np.ones(len(self.data[lowest]), dtype=bool)
 
     def duration(self, duration, samplerate=1, mindur=True):
         """Require each true part to be at least duration long.
@@ -344,16 +409,34 @@ class ChannelPack(object):
 
         req_duration = int(duration * samplerate)
 
-        for sc in self._cached_slicelist:
+        # no true part is shorter than one element, skip the scan. Still
+        # drop the cache, the mask might have been edited in place.
+        if mindur and req_duration <= 1:
+            self._cached_slicelist = None
+            return self.mask
+
+        # a slicelist cached before this call might be stale, the mask
+        # can be edited in place without going through __setattr__
+        fresh = self._cached_slicelist is None
+
+        keptslices = []
+        for sc in self._partslices():
             part_duration = sc.stop - sc.start
             if part_duration < req_duration and mindur:
                 self.mask[sc] = False
             elif part_duration > req_duration and not mindur:
                 self.mask[sc] = False
-
-        # need to reset _cached_slicelist because the __setattr__ is not called
-        # when mask is manipulated this way
-        self._cached_slicelist = self._slicelist()
+            else:
+                keptslices.append(sc)
+
+        # need to update _cached_slicelist because the __setattr__ is not
+        # called when mask is manipulated this way. Falsifying whole parts
+        # leaves the other parts as they were, so the kept slices are
+        # right if they were produced from the current mask.
+        if fresh:
+            self._cached_slicelist = keptslices
+        else:
+            self._cached_slicelist = None
 
         return self.mask
 
@@ -389,7 +472,7 @@ class ChannelPack(object):
 
         """
 
-        result = np.array(tuple(datautils.startstop_bool(startb, stopb)))
+        result = datautils.startstop_array(startb, stopb)
         if apply:
             self.mask &= result
         return result
@@ -405,6 +488,18 @@ class ChannelPack(object):
         """
         return datautils.slicelist(self.mask)
 
+    def _partslices(self):
+        """Return the cached slicelist, produce it first if necessary.
+
+        The cache is invalidated when the mask is set and produced on
+        first use after that, so masks that are never asked for parts
+        are never scanned.
+
+        """
+        if self._cached_slicelist is None:
+            self._cached_slicelist = self._slicelist()
+        return self._cached_slicelist
+
     def parts(self):
         """Return the enumeration of the True parts.
 
@@ -414,7 +509,7 @@ class ChannelPack(object):
 
         """
 
-        return list(range(len(self._cached_slicelist)))  # 2&3
+        return list(range(len(self._partslices())))  # 2&3
 
     def __call__(self, ch, part=None, nof=None):
         """Return data from "channel" ch.
@@ -444,7 +539,7 @@ class ChannelPack(object):
         key = self._datakey(ch)
 
         if part is not None:
-            sl = self._cached_slicelist
+            sl = self._partslices()
             try:
                 return self.data[key][sl[part]]
             except IndexError:
@@ -501,18 +596,28 @@ class ChannelPack(object):
 
         """
 
-        names = [self.names[key] for key in sorted(self.names)]
         if fallback:
-            names = [self.FALLBACK_PREFIX + str(key) for key in
-                     sorted(self.data)]
+            keys = sorted(self.data)
+            fallbackfmt = (self.FALLBACK_PREFIX + '{}').format
+            names = list(map(fallbackfmt, keys))
+        else:
+            keys = sorted(self.names)
+            names = [self.names[key] for key in keys]
 
         try:
             Record = namedtuple('Record', names)
         except ValueError:      # bad names
             raise ValueError('Includes invalid names: {}'.format(names))
 
-        for record in map(Record._make, zip(*[self(name, part=part, nof=nof)
-                                              for name in names])):
+        # the keys are known, no need to resolve the names again. Only
+        # check that they are in data.
+        for key, name in zip(keys, names):
+            if key not in self.data:
+                fmt = '{} value in names with key {} but {} not in data'
+                raise KeyError(fmt.format(name, key, key))
+
+        for record in map(Record._make, zip(*[self(key, part=part, nof=nof)
+                                              for key in keys])):
             yield record
 
     def _datakey(self, ch):
@@ -532,30 +637,35 @@ class ChannelPack(object):
 
         """
 
-        if ch in self.data:
-            return ch
+        # data keys are integers, a string is never one of them
+        if not isinstance(ch, _string_types):
+            if ch in self.data:
+                return ch
 
-        # if ch is an int and we are here, there is no match
-        if isinstance(ch, int):
-            raise KeyError('{} not in data'.format(ch))
+            # if ch is an int and we are here, there is no match
+            if isinstance(ch, (int, np.integer)):
+                raise KeyError('{} not in data'.format(ch))
 
-        for key, name in self.names.items():
-            if ch == name:
-                if key not in self.data:
-                    fmt = '{} value in names with key {} but {} not in data'
-                    raise KeyError(fmt.format(name, key, key))
-                return key
+        try:
+            key = self.names._key_of(ch)
+        except KeyError:
+            pass
+        else:
+            if key not in self.data:
+                fmt = '{} value in names with key {} but {} not in data'
+                raise KeyError(fmt.format(ch, key, key))
+            return key
 
         # not in data, not a good name in names, last chance is a
-        # fallback string
-
-        prefix_rx = self.FALLBACK_PREFIX + r'(\d+)'
-        m = re.match(prefix_rx, ch)
-
-        if m:
-            key = int(m.group(1))
-            if key in self.data:
-                return key
+        # fallback string. Only run the regex on strings that can match.
+
+        prefix = self.FALLBACK_PREFIX
+        if isinstance(ch, _string_types) and ch.startswith(prefix):
+            m = _fallback_rx(prefix).match(ch)
+            if m:
+                key = int(m.group(1))
+                if key in self.data:
+                    return key
 
         raise KeyError(ch)
 
@@ -5,6 +5,7 @@ Funtions for reading data from text files.
 from __future__ import print_function
 import re
 from collections import namedtuple, defaultdict
+from itertools import compress
 import io
 import locale
 import string
@@ -18,12 +19,13 @@ from channelpack import pack as cp
 DNUMRX = r'[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?'  # With decimal point
 CNUMRX = r'[-+]?(?:\d+(?:,\d*)?|,\d+)(?:[eE][-+]?\d+)?'  # With decimal comma
 
+_DNUM_RX = re.compile(DNUMRX)
+_CNUM_RX = re.compile(CNUMRX)
+
 
 def _escape(s):
     """Escape re-special characters in s and return it."""
-    s = s.replace('+', r'\+')
-    s = s.replace('.', r'\.')
-    return s
+    return re.escape(s)
 
 
 def _floatit(s):
@@ -77,8 +79,8 @@ def preparse(lines, firstfieldrx=r'\w'):
 
     for line in lines:
         # collect all numbers on the line
-        dnumbersline = re.findall(DNUMRX, line)
-        cnumbersline = re.findall(CNUMRX, line)
+        dnumbersline = _DNUM_RX.findall(line)
+        cnumbersline = _CNUM_RX.findall(line)
 
         # rx to search for data separator on the line:
         dsep_rx = nodigsrx.join(map(_escape, dnumbersline))
@@ -139,9 +141,9 @@ def preparse(lines, firstfieldrx=r'\w'):
     # any non-numbers, non-whites around the number
     elif exp_septypcnt == 0:
         if ((flag == 'd' and any(m.strip()
-                                 for m in re.split(DNUMRX, lines[-1])))
+                                 for m in _DNUM_RX.split(lines[-1])))
             or (flag == 'c' and any(m.strip()
-                                    for m in re.split(CNUMRX, lines[-1])))):
+                                    for m in _CNUM_RX.split(lines[-1])))):
             return {}
 
     # Data starts before line where number of different seps is not 1
@@ -523,13 +525,17 @@ def linetuples(fo, bytehint=False, delimiter=None, usecols=None,
         yield tuple(namesfunc(name) for name, col in
                     zip(fieldnames, allcols) if col in usecols)
 
-    yield tuple(func(val) for func, val, col in
-                zip(funcs, firstvals, allcols) if col in usecols)
+    # the used columns are picked with compress from the (func, value)
+    # pairs, no membership test per field and line
+    selectors = [col in usecols for col in allcols]
+
+    yield tuple([func(val) for func, val in
+                 compress(zip(funcs, firstvals), selectors)])
 
     for line in fo:
         stripped = line.strip(stripchars)
         if not stripped:
             continue
-        yield tuple(func(val) for func, val, col in
-                    zip(funcs, stripped.split(delimiter), allcols)
-                    if col in usecols)
+        yield tuple([func(val) for func, val in
+                     compress(zip(funcs, stripped.split(delimiter)),
+                              selectors)])
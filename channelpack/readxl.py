@@ -7,7 +7,10 @@ from collections import namedtuple
 import numpy as np
 
 from channelpack.pack import ChannelPack
-from channelpack import xlrd
+
+# The bundled xlrd package is imported in the functions using it. It is
+# the bulk of the import time of channelpack and only needed for
+# spread sheets.
 
 # Type symbol      Type     Python value
 #                  number
@@ -29,6 +32,8 @@ from channelpack import xlrd
 
 CellRef = namedtuple('CellRef', ('row', 'col'))
 
+_XLADDR_RX = re.compile(r'([A-Za-z]+)(\d*)')
+
 
 def cellreference(row=0, col=0, xladdr=None):
     """Return a CellRef object with 0-based row and col.
@@ -40,7 +45,7 @@ def cellreference(row=0, col=0, xladdr=None):
     if not xladdr:
         return CellRef(int(row), int(col))
 
-    m = re.match(r'([A-Za-z]+)(\d*)', xladdr)
+    m = _XLADDR_RX.match(xladdr)
     if not m:
         raise ValueError('Invalid notation:', xladdr)
     if not m.group(2):
@@ -57,6 +62,8 @@ def sheet_columns(ws, startref, stopref, usecols):
 
     startref and stopref to be CellRef objects."""
 
+    from channelpack import xlrd
+
     numericset = {xlrd.XL_CELL_NUMBER, xlrd.XL_CELL_EMPTY,
                   xlrd.XL_CELL_ERROR, xlrd.XL_CELL_BLANK}
     textset = {xlrd.XL_CELL_TEXT, xlrd.XL_CELL_EMPTY,
@@ -121,6 +128,8 @@ def sheetpack(fname, sheet=0, header=True, startcell=None, stopcell=None,
 
     """
 
+    from channelpack import xlrd
+
     startref = cellreference(xladdr=startcell)
     stopref = cellreference(xladdr=stopcell)
 
@@ -160,7 +169,8 @@ def normalize_usecols(usecols):
     """Normalize usecols to a sequence of integers."""
 
     try:
-        patterns = [p.strip() for p in usecols.split(',') if p.strip()]
+        stripped = (part.strip() for part in usecols.split(','))
+        patterns = [p for p in stripped if p]
     except AttributeError:
         return sorted([int(c) for c in usecols])  # fail if int cast fail
 
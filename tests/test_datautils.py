@@ -104,3 +104,87 @@ class TestStartStopBool(unittest.TestCase):
                 self.assertTrue(compare)
             else:
                 self.assertFalse(compare)
+
+
+class TestStartStopArray(unittest.TestCase):
+    """Test the startstop_array function."""
+
+    def setUp(self):
+        self.a_height = np.array((1, 2, 3, 4, 5, 4, 3, 2, 1, 2, 3, 4, 5, 4,
+                                  3, 2, 1))
+        self.expected = (5, 4, 3, 2, 5, 4, 3, 2)
+
+    def test_with_numpy_arrays_as_args(self):
+        descends = du.startstop_array(self.a_height == 5, self.a_height == 1)
+        self.assertEqual(descends.dtype, bool)
+        self.assertTrue(np.all(self.a_height[descends] == self.expected))
+
+    def test_with_empty_sequences(self):
+        self.assertEqual(len(du.startstop_array((), ())), 0)
+
+    def test_truncated_to_shortest(self):
+        self.assertEqual(len(du.startstop_array((0, 1, 0, 0), (0, 0))), 2)
+
+    def test_truth_of_elements(self):
+        startb = ('', 'go', '', '', '')
+        stopb = (0, 0, 0, 2.5, 0)
+        self.assertEqual(list(du.startstop_array(startb, stopb)),
+                         [False, True, True, False, False])
+
+    def test_same_as_startstop_bool(self):
+        startb = (1, 1, 0, 0, 1, 0, 1, 1, 0, 0)
+        stopb = (0, 1, 0, 1, 1, 0, 0, 0, 1, 0)
+        self.assertEqual(list(du.startstop_array(startb, stopb)),
+                         list(du.startstop_bool(startb, stopb)))
+
+    def test_with_iterators(self):
+        startb = (x for x in [1, 0, 0])
+        stopb = iter([0, 0, 1])
+        self.assertEqual(list(du.startstop_array(startb, stopb)),
+                         [True, True, False])
+
+
+class TestSliceList(unittest.TestCase):
+    """Test the slicelist function."""
+
+    def test_all_true(self):
+        self.assertEqual(du.slicelist(np.ones(4, dtype=bool)), [slice(0, 4)])
+
+    def test_all_false(self):
+        self.assertEqual(du.slicelist(np.zeros(4, dtype=bool)), [])
+
+    def test_empty(self):
+        self.assertEqual(du.slicelist(np.array([])), [])
+
+    def test_true_at_ends(self):
+        b = np.array([1, 0, 0, 1, 1, 0, 1], dtype=bool)
+        self.assertEqual(du.slicelist(b),
+                         [slice(0, 1), slice(3, 5), slice(6, 7)])
+
+    def test_slices_select_true_parts(self):
+        b = np.array([0, 1, 1, 0, 1, 0], dtype=bool)
+        a = np.arange(len(b))
+        parts = [a[sc] for sc in du.slicelist(b)]
+        self.assertEqual([list(part) for part in parts], [[1, 2], [4]])
+
+    def test_with_generator(self):
+        self.assertEqual(du.slicelist(x for x in [1, 0, 1]),
+                         [slice(0, 1), slice(2, 3)])
+
+
+class TestMasked(unittest.TestCase):
+    """Test the masked function."""
+
+    def test_dtypes(self):
+        b = np.array([True, False, True])
+        for dtype, expected in (('i1', 'f8'), ('i8', 'f8'), ('u4', 'f8'),
+                                ('f2', 'f8'), ('f4', 'f8'), ('f8', 'f8'),
+                                ('c8', 'c16'), ('c16', 'c16')):
+            result = du.masked(np.arange(3, dtype=dtype), b)
+            self.assertEqual(result.dtype, np.dtype(expected))
+            self.assertTrue(np.isnan(result[1]))
+            self.assertEqual(list(result[::2]), [0, 2])
+
+    def test_none_fill(self):
+        result = du.masked(np.array(['a', 'b', 'c']), [True, False, True])
+        self.assertEqual(list(result), ['a', None, 'c'])
@@ -238,6 +238,16 @@ class TestDbfRecords(unittest.TestCase):
         self.assertEqual(lastrec[-2], 2655.0)
         self.assertEqual(lastrec[-1], 841.0)
 
+    def test_sids_truncated(self):
+        with io.open(SIDS, 'rb') as fo:
+            truncated = io.BytesIO(fo.read()[:-20])
+
+        dbfrecs = dbf.dbfrecords(truncated, sidsxnames)
+        with self.assertRaises(ValueError) as cm:
+            list(dbfrecs)
+        self.assertIn('record {} of {}'.format(SIDSLEN, SIDSLEN),
+                      str(cm.exception))
+
 
 class TestDbfPack(unittest.TestCase):
 
@@ -406,6 +406,32 @@ class TestPackBasics(unittest.TestCase):
         self.assertIsInstance(pack('letter'), np.ndarray)
         self.assertIsInstance(pack('number'), np.ndarray)
 
+    def test_calls_by_names_after_names_modified(self):
+
+        pack = self.pack
+        pack.names[1] = 'digit'
+        self.assertIsInstance(pack('digit'), np.ndarray)
+        self.assertRaises(KeyError, pack, 'number')
+        del pack.names[1]
+        self.assertRaises(KeyError, pack, 'digit')
+        pack.names.update({1: 'number'})
+        self.assertIsInstance(pack('number'), np.ndarray)
+        pack.names.pop(0)
+        self.assertRaises(KeyError, pack, 'letter')
+        pack.names |= {1: 'digit'}
+        self.assertIsInstance(pack('digit'), np.ndarray)
+        self.assertRaises(KeyError, pack, 'number')
+        with self.assertRaises(TypeError):
+            pack.names |= {'1': 'number'}
+        pack.names.clear()
+        self.assertRaises(KeyError, pack, 'number')
+
+    def test_calls_by_duplicated_names(self):
+
+        pack = self.pack
+        pack.names = {1: 'same', 0: 'same'}
+        self.assertEqual(pack._datakey('same'), 1)
+
     def test_calls_by_fallbacknames(self):
 
         pack = self.pack
@@ -538,6 +564,15 @@ class TestPackBasics(unittest.TestCase):
         with self.assertRaises(ValueError):
             pack.nof = np.nan
 
+    def test_nof_filter_mask_length_mismatch(self):
+        pack = packmod.ChannelPack({0: [1, 2, 3], 1: [1, 2, 3, 4, 5]})
+        pack.nof = 'filter'
+        with self.assertRaises(IndexError):
+            pack(1)
+        pack.mask = np.array([True, False])
+        with self.assertRaises(IndexError):
+            pack(0, nof='filter')
+
     def test_mask_value_checking(self):
         pack = self.pack
         with self.assertRaises(TypeError):
@@ -550,6 +585,11 @@ class TestPackBasics(unittest.TestCase):
         pack.mask_reset()
         self.assertTrue(np.all(pack.mask))
 
+    def test_mask_reset_with_nan(self):
+        pack = packmod.ChannelPack({0: [1.0, np.nan, 3.0]})
+        self.assertTrue(np.all(pack.mask))
+        self.assertEqual(pack.mask.dtype, bool)
+
     def test_append_pack(self):
         pack = self.pack
         self.assertEqual(pack(0).size, len(self.D1[0]))
@@ -653,6 +693,14 @@ class TestPackBasics(unittest.TestCase):
             self.assertEqual(record.ch0, pack('letter')[index])
             self.assertEqual(record.ch1, pack('number')[index])
 
+    def test_records_names_key_not_in_data(self):
+        pack = self.pack
+        pack.names[2] = 'extra'
+        with self.assertRaises(KeyError) as cm:
+            list(pack.records())
+        msg = 'extra value in names with key 2 but 2 not in data'
+        self.assertEqual(cm.exception.args, (msg,))
+
     def test_records_empty_pack(self):
         pack = packmod.ChannelPack()
         count = 0
@@ -683,6 +731,18 @@ class TestPackBasics(unittest.TestCase):
         self.assertRaises(KeyError, pack._datakey, 'no such name')
         self.assertEqual(1, pack._datakey('number'))
 
+    def test__datakey_not_a_string(self):
+        pack = self.pack
+        self.assertRaises(KeyError, pack._datakey, 1.5)
+        self.assertRaises(KeyError, pack._datakey, (0, 1))
+
+    def test__datakey_numpy_integer(self):
+        pack = self.pack
+        self.assertEqual(1, pack._datakey(np.int64(1)))
+        with self.assertRaises(KeyError) as cm:
+            pack._datakey(np.int64(2))
+        self.assertEqual(cm.exception.args, ('2 not in data',))
+
     def test_name(self):
         pack = self.pack
         self.assertEqual(pack.name(1), 'number')
@@ -877,6 +937,22 @@ class TestPackDuration(unittest.TestCase):
         self.assertFalse(any(pack.mask))
         self.assertEqual(pack.parts(), [])
 
+    def test_duration_after_mask_edited_in_place(self):
+        pack = self.pack
+        pack.mask = pack('number') == 3
+        self.assertEqual(pack.parts(), [0])
+        pack.mask[3] = False
+        pack.duration(1, mindur=False)
+        self.assertEqual(pack.parts(), [])
+        self.assertRaises(IndexError, pack, 0, part=0)
+
+    def test_duration_1_after_mask_edited_in_place(self):
+        pack = self.pack
+        self.assertEqual(pack.parts(), [0])
+        pack.mask[2] = False
+        pack.duration(1)
+        self.assertEqual(pack.parts(), [0, 1])
+
     def test_mindur_resetting(self):
         pack = self.pack
         pack.mask = pack('number') < 2